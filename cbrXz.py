@@ -5,10 +5,12 @@ import logging
 import os
 import rarfile
 import shutil
+import stat
 import tempfile
 import zipfile
 import re
 from importlib import metadata as _metadata
+from typing import Iterable, List, NamedTuple
 
 
 
@@ -16,6 +18,16 @@ from importlib import metadata as _metadata
 logger = logging.getLogger(__name__)
 
 BOOK_TYPES = ['.cbr', '.rar', '.cbz', '.zip', '.cb7', '.7z', '.pdf', '.epub']
+PAGE_ORDERS = ['natural', 'archive']
+
+_DIGITS = re.compile(r'(\d+)')
+
+
+class Page(NamedTuple):
+    """One manifest entry for a member that will be written to the .cbz."""
+    arcname: str
+    size: int
+    crc: int
 
 def get_version() -> str:
     """Return the project version from installed package metadata.
@@ -49,6 +61,37 @@ def filterPage(s: str) -> bool:
         return True
     return False
 
+def naturalKey(s: str) -> tuple:
+    """Return a case-insensitive, numeric-aware sort key for a page path.
+    'page2.jpg' sorts before 'page10.jpg'. Digit runs always land on odd
+    indexes of the split, so ints are only ever compared with ints.
+    """
+    parts = _DIGITS.split(s.lower())
+    parts[1::2] = [int(d) for d in parts[1::2]]
+    return tuple(parts)
+
+def buildManifest(infos: Iterable, order: str = 'natural') -> List[Page]:
+    """Build the page manifest for a book from archive member headers.
+    Arcnames are sanitized with the same rules rarfile uses on extraction,
+    so they name the extracted files; empty names are dropped and duplicates
+    keep the last header (which wins on disk) at its first position. For
+    natural ordering, the sort key is computed once per member.
+    """
+    entries = {}
+    for info in infos:
+        # symlink headers describe the link, not its target; keep regular files only
+        if not info.is_file():
+            continue
+        arcname = rarfile.sanitize_filename(info.filename, '/', rarfile.WIN32)
+        if not arcname or filterPage(arcname):
+            continue
+        entries[arcname] = Page(arcname, info.file_size, info.CRC)
+    pages = list(entries.values())
+    if order == 'natural':
+        # list.sort evaluates the key exactly once per entry
+        pages.sort(key=lambda p: naturalKey(p.arcname))
+    return pages
+
 
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(version=f"v{get_version()}", prog_name="cbrXz")
@@ -57,8 +100,9 @@ def filterPage(s: str) -> bool:
 @click.option('--root', required=False, type=click.Path(exists=True, dir_okay=True, file_okay=True, path_type=str), help='Override root for relative paths')
 @click.option('-F', '--replace', is_flag=True, help='Overwrite existing destination files')
 @click.option('-N', '--dry-run', 'dryrun', is_flag=True, help='Plan actions but do not write outputs')
+@click.option('--page-order', default='natural', type=click.Choice(PAGE_ORDERS, case_sensitive=False), help='Page order in repacked archives: natural (numeric-aware) or archive (as stored)')
 @click.option('--log-level', default='INFO', type=click.Choice(['CRITICAL','ERROR','WARNING','INFO','DEBUG','NOTSET'], case_sensitive=False), help='Logging verbosity')
-def main(src, dst, root, replace, dryrun, log_level):
+def main(src, dst, root, replace, dryrun, page_order, log_level):
     # cfg = {}
     total = 0
     books = []
@@ -166,6 +210,8 @@ def main(src, dst, root, replace, dryrun, log_level):
                     logger.debug("       tmp_x_dir: %s", tmp_x_dir)
                     try:
                         with rarfile.RarFile(book) as rar:
+                            manifest = buildManifest(rar.infolist(), page_order.lower())
+                            logger.debug("        manifest: %d pages", len(manifest))
                             logger.info("EVENT: extracting %s to %s", book_f, tmp_x_dir)
                             try:
                                 rar.extractall(tmp_x_dir)
@@ -204,34 +250,39 @@ def main(src, dst, root, replace, dryrun, log_level):
                         logger.debug("        t_book_z: %s", t_book_z)
                         with zipfile.ZipFile(t_book_z, 'w', compression=zipfile.ZIP_STORED) as zip:
                             hasComicInfoXml = False
-                            pages = []
-                            for xt_p, _, xt_fis in os.walk(tmp_x_dir):
-                                for xt_fi in xt_fis:
-                                    rel = os.path.relpath(os.path.join(xt_p, xt_fi), start=tmp_x_dir)
-                                    rel = rel.replace(os.sep, '/')
-                                    if filterPage(rel):
-                                        continue
-                                    # TBD: test for credit pages, comicinfo.xml
-                                    if xt_fi in ['ComicInfo.xml']:
-                                        hasComicInfoXml = True
-                                        logger.debug("comicinfo exists.")
-                                    pages.append(os.path.join(xt_p, xt_fi))
-                            if not hasComicInfoXml:
-                                logger.debug("no comicinfo.xml found - injecting skeleton(?)")
-                            pages.sort()
+                            real_x_dir = os.path.realpath(tmp_x_dir)
                             logger.info("EVENT: making %s ", t_book_z)
-                            for page in pages:
-                                logger.debug("            page: %s", page)
-                                page_f = os.path.relpath(page, start=tmp_x_dir).replace(os.sep, "/")
-                                if filterPage(page_f):
+                            for page in manifest:
+                                logger.debug("            page: %s", page.arcname)
+                                page_x = os.path.realpath(os.path.join(real_x_dir, *page.arcname.split('/')))
+                                if not page_x.startswith(real_x_dir + os.sep):
+                                    logger.warning("Page %s in %s resolves outside the extraction dir - skipping.", page.arcname, book_f)
                                     continue
-                                logger.debug("          page_f: %s", page_f)
-                                zip.write(page, page_f)
-                            logger.info("EVENT: copying %s to %s", book_z, book_destination)
-                            if not dryrun:
-                                if os.path.isfile(f_book_z):
-                                    os.unlink(f_book_z)
-                                shutil.copy2(t_book_z, f_book_z)
+                                try:
+                                    page_st = os.stat(page_x)
+                                except OSError:
+                                    page_st = None
+                                if page_st is None or not stat.S_ISREG(page_st.st_mode):
+                                    logger.warning("Missing extracted page %s in %s - skipping.", page.arcname, book_f)
+                                    continue
+                                if page_st.st_size != page.size:
+                                    logger.warning("Size mismatch for %s in %s - header says %d, extracted %d.", page.arcname, book_f, page.size, page_st.st_size)
+                                # TBD: test for credit pages, comicinfo.xml
+                                if page.arcname.rsplit('/', 1)[-1] == 'ComicInfo.xml':
+                                    hasComicInfoXml = True
+                                    logger.debug("comicinfo exists.")
+                                zip.write(page_x, page.arcname)
+                                # zipfile computes the CRC while writing, so this check is free;
+                                # RAR5 members hashed with BLAKE2 carry no CRC32 (None)
+                                if page.crc is not None and zip.getinfo(page.arcname).CRC != page.crc:
+                                    logger.warning("CRC mismatch for %s in %s - some data loss likely.", page.arcname, book_f)
+                            if not hasComicInfoXml:
+                                logger.debug("no comicinfo.xml found - injecting skeleton(?)")
+                        logger.info("EVENT: copying %s to %s", book_z, book_destination)
+                        if not dryrun:
+                            if os.path.isfile(f_book_z):
+                                os.unlink(f_book_z)
+                            shutil.copy2(t_book_z, f_book_z)
         else:
             # Determine destination filename: rename .zip -> .cbz and .7z -> .cb7
             if book_t == '.zip':
@@ -0,0 +1,97 @@
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+import zipfile
+import zlib
+
+import pytest
+from click.testing import CliRunner
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+import cbrXz  # noqa: E402
+
+# Stored (archive) order of the fake RAR members
+MEMBERS = {
+    'page10.jpg': b'ten',
+    'Thumbs.db': b'junk',
+    'page2.jpg': b'two',
+    'page1.jpg': b'one',
+    'ComicInfo.xml': b'<ComicInfo/>',
+}
+
+
+class FakeRarFile:
+    # per-member header overrides, e.g. {'page1.jpg': {'CRC': None}}
+    HEADERS = {}
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def infolist(self):
+        infos = []
+        for name, data in MEMBERS.items():
+            header = {'file_size': len(data), 'CRC': zlib.crc32(data), **self.HEADERS.get(name, {})}
+            infos.append(SimpleNamespace(filename=name, is_dir=lambda: False, is_file=lambda: True, **header))
+        return infos
+
+    def extractall(self, path):
+        for name, data in MEMBERS.items():
+            (Path(path) / name).write_bytes(data)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('order, expected', [
+    ('natural', ['ComicInfo.xml', 'page1.jpg', 'page2.jpg', 'page10.jpg']),
+    ('archive', ['page10.jpg', 'page2.jpg', 'page1.jpg', 'ComicInfo.xml']),
+])
+def test_repack_page_order(tmp_path, monkeypatch, order, expected):
+    monkeypatch.setattr(cbrXz.rarfile, 'RarFile', FakeRarFile)
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'book.cbr').write_bytes(b'not really a rar')
+    dst = tmp_path / 'dst'
+
+    result = CliRunner().invoke(cbrXz.main, [str(src), str(dst), '--page-order', order])
+    assert result.exit_code == 0, result.output
+
+    with zipfile.ZipFile(dst / 'book.cbz') as zf:
+        assert zf.namelist() == expected
+        assert zf.read('page2.jpg') == b'two'
+        assert all(i.compress_type == zipfile.ZIP_STORED for i in zf.infolist())
+
+
+def _repack(tmp_path, monkeypatch, headers):
+    monkeypatch.setattr(cbrXz.rarfile, 'RarFile', FakeRarFile)
+    monkeypatch.setattr(FakeRarFile, 'HEADERS', headers)
+    src = tmp_path / 'src'
+    src.mkdir()
+    (src / 'book.cbr').write_bytes(b'not really a rar')
+    result = CliRunner().invoke(cbrXz.main, [str(src), str(tmp_path / 'dst')])
+    assert result.exit_code == 0, result.output
+    with zipfile.ZipFile(tmp_path / 'dst' / 'book.cbz') as zf:
+        return zf.namelist()
+
+
+@pytest.mark.integration
+def test_repack_without_crc32_logs_no_mismatch(tmp_path, monkeypatch, caplog):
+    # RAR5 members hashed with BLAKE2 have CRC=None in rarfile
+    names = _repack(tmp_path, monkeypatch, {name: {'CRC': None} for name in MEMBERS})
+    assert 'page2.jpg' in names
+    assert 'mismatch' not in caplog.text
+
+
+@pytest.mark.integration
+def test_repack_logs_crc_and_size_mismatch(tmp_path, monkeypatch, caplog):
+    headers = {'page1.jpg': {'CRC': 0}, 'page2.jpg': {'file_size': 99}}
+    names = _repack(tmp_path, monkeypatch, headers)
+    assert 'page1.jpg' in names and 'page2.jpg' in names
+    assert 'CRC mismatch for page1.jpg' in caplog.text
+    assert 'Size mismatch for page2.jpg' in caplog.text
+    assert caplog.text.count('mismatch for') == 2
@@ -24,3 +24,10 @@ def test_version_flag(run_cli):
     proc = run_cli(["--version"])
     assert proc.returncode == 0
     assert proc.stdout.strip().startswith("cbrXz, version v") or proc.stdout.strip().startswith("v")
+
+
+def test_cli_rejects_unknown_page_order(tmp_path: Path, run_cli, zip_with_file: Callable):
+    src = zip_with_file(tmp_path / "book.cbz")
+    proc = run_cli([src, tmp_path / "out", "--page-order", "random"])
+    assert proc.returncode != 0
+    assert "--page-order" in (proc.stderr + proc.stdout)
@@ -0,0 +1,63 @@
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+import cbrXz  # noqa: E402
+
+
+def _info(name, size=1, crc=0, is_dir=False, is_file=None):
+    if is_file is None:
+        is_file = not is_dir
+    return SimpleNamespace(filename=name, file_size=size, CRC=crc, is_dir=lambda: is_dir, is_file=lambda: is_file)
+
+
+def test_naturalkey_orders_unpadded_numbers():
+    names = ['page10.jpg', 'page2.jpg', 'Page1.jpg']
+    assert sorted(names, key=cbrXz.naturalKey) == ['Page1.jpg', 'page2.jpg', 'page10.jpg']
+
+
+def test_naturalkey_orders_numbered_directories():
+    names = ['ch10/p1.jpg', 'ch9/p2.jpg', 'ch9/p10.jpg']
+    assert sorted(names, key=cbrXz.naturalKey) == ['ch9/p2.jpg', 'ch9/p10.jpg', 'ch10/p1.jpg']
+
+
+def test_manifest_natural_order_and_filtering():
+    infos = [
+        _info('sub', is_dir=True),
+        _info('sub/page10.jpg', 10, 0xA),
+        _info('sub/page2.jpg', 2, 0x2),
+        _info('Thumbs.db'),
+        _info('__MACOSX/sub/._page2.jpg'),
+        _info('ComicInfo.xml', 5, 0x5),
+    ]
+    manifest = cbrXz.buildManifest(infos)
+    assert [p.arcname for p in manifest] == ['ComicInfo.xml', 'sub/page2.jpg', 'sub/page10.jpg']
+    assert manifest[1] == cbrXz.Page('sub/page2.jpg', 2, 0x2)
+
+
+def test_manifest_archive_order_is_kept():
+    infos = [_info('page10.jpg'), _info('page2.jpg'), _info('page1.jpg')]
+    manifest = cbrXz.buildManifest(infos, 'archive')
+    assert [p.arcname for p in manifest] == ['page10.jpg', 'page2.jpg', 'page1.jpg']
+
+
+def test_manifest_drops_dot_segments_like_extractor():
+    manifest = cbrXz.buildManifest([_info('../x.jpg'), _info('./a.jpg'), _info('sub//b.jpg'), _info('..')])
+    assert [p.arcname for p in manifest] == ['a.jpg', 'sub/b.jpg', 'x.jpg']
+
+
+def test_manifest_replaces_bad_characters():
+    manifest = cbrXz.buildManifest([_info('page?.jpg'), _info('"cover".jpg')])
+    assert [p.arcname for p in manifest] == ['_cover_.jpg', 'page_.jpg']
+
+
+def test_manifest_dedupes_sanitized_names():
+    manifest = cbrXz.buildManifest([_info('./a.jpg', 1, 0x1), _info('b.jpg'), _info('a.jpg', 2, 0x2)], 'archive')
+    assert manifest == [cbrXz.Page('a.jpg', 2, 0x2), cbrXz.Page('b.jpg', 1, 0)]
+
+
+def test_manifest_skips_symlinks_and_other_non_files():
+    manifest = cbrXz.buildManifest([_info('link.jpg', is_file=False), _info('page1.jpg')])
+    assert [p.arcname for p in manifest] == ['page1.jpg']